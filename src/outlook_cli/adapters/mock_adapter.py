@@ -26,6 +26,8 @@ class MockOutlookAdapter(OutlookAdapter):
     def _create_test_emails(self) -> Dict[str, List[Email]]:
         """Create realistic test emails for different folders."""
         emails = {}
+        # One reference time keeps the relative ages consistent across emails
+        now = datetime.now(timezone.utc)
         
         # Inbox emails
         emails["Inbox"] = [
@@ -35,7 +37,7 @@ class MockOutlookAdapter(OutlookAdapter):
                 sender_email="manager@company.com",
                 sender_name="Alice Manager",
                 recipient_emails=["user@company.com"],
-                received_date=datetime.now(timezone.utc) - timedelta(hours=2),
+                received_date=now - timedelta(hours=2),
                 body_text="Hi team, our weekly meeting is scheduled for Friday at 2 PM.",
                 folder_path="Inbox",
                 has_attachments=False,
@@ -48,7 +50,7 @@ class MockOutlookAdapter(OutlookAdapter):
                 sender_email="pm@company.com",
                 sender_name="Bob ProjectManager",
                 recipient_emails=["user@company.com", "team@company.com"],
-                received_date=datetime.now(timezone.utc) - timedelta(days=1),
+                received_date=now - timedelta(days=1),
                 body_text="Please provide an update on the current project status.",
                 folder_path="Inbox",
                 has_attachments=True,
@@ -61,7 +63,7 @@ class MockOutlookAdapter(OutlookAdapter):
                 sender_email="it@company.com",
                 sender_name="IT Support",
                 recipient_emails=["all@company.com"],
-                received_date=datetime.now(timezone.utc) - timedelta(days=2),
+                received_date=now - timedelta(days=2),
                 body_text="The system will be down for maintenance this weekend.",
                 folder_path="Inbox",
                 has_attachments=False,
@@ -77,7 +79,7 @@ class MockOutlookAdapter(OutlookAdapter):
                 sender_email="user@company.com",
                 sender_name="Current User",
                 recipient_emails=["pm@company.com"],
-                received_date=datetime.now(timezone.utc) - timedelta(hours=6),
+                received_date=now - timedelta(hours=6),
                 body_text="The project is on track and will be completed by Friday.",
                 folder_path="Sent Items",
                 has_attachments=False,
@@ -89,7 +91,7 @@ class MockOutlookAdapter(OutlookAdapter):
                 sender_email="user@company.com",
                 sender_name="Current User",
                 recipient_emails=["team@company.com"],
-                received_date=datetime.now(timezone.utc) - timedelta(days=3),
+                received_date=now - timedelta(days=3),
                 body_text="Here are the notes from yesterday's meeting.",
                 folder_path="Sent Items",
                 has_attachments=True,
@@ -106,7 +108,7 @@ class MockOutlookAdapter(OutlookAdapter):
                 sender_email="user@company.com",
                 sender_name="Current User",
                 recipient_emails=["hr@company.com"],
-                received_date=datetime.now(timezone.utc) - timedelta(hours=12),
+                received_date=now - timedelta(hours=12),
                 body_text="I would like to request vacation time for next month.",
                 folder_path="Drafts",
                 has_attachments=False,
@@ -128,15 +130,17 @@ class MockOutlookAdapter(OutlookAdapter):
         raise ValueError(f"Folder '{folder_path}' not found")
     
     def get_emails(self, folder_path: str) -> List[Email]:
-        """Get all emails from a specific folder."""
+        """Get all emails from a specific folder, without message bodies."""
         # First check if folder exists
         if not any(folder.path == folder_path for folder in self._folders):
             raise ValueError(f"Folder '{folder_path}' not found")
         
-        # Return emails if folder exists (empty list if no emails in folder)
-        if folder_path not in self._emails:
-            return []
-        return self._emails[folder_path].copy()
+        # Return emails if folder exists (empty list if no emails in folder).
+        # Listings carry headers only, matching the real adapter.
+        return [
+            email.model_copy(update={"body_text": "", "body_html": None})
+            for email in self._emails.get(folder_path, [])
+        ]
     
     def move_email(self, email_id: str, target_folder: str) -> bool:
         """Move an email to a different folder."""
@@ -5,7 +5,7 @@ dependency injection and cross-platform development.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 from outlook_cli.models import Email, Folder
 
 
@@ -40,21 +40,61 @@ class OutlookAdapter(ABC):
         """
         pass
     
+    def folder_exists(self, folder_path: str) -> bool:
+        """Check whether a folder path exists without reading its statistics.
+        
+        The default implementation scans get_folders. Adapters backed by a
+        remote store can override this with a direct path lookup.
+        
+        Args:
+            folder_path: The path to the folder (e.g., 'Inbox', 'Inbox/Subfolder').
+            
+        Returns:
+            bool: True if the folder exists, False otherwise.
+            
+        Raises:
+            ValueError: If the lookup itself fails, so existence is unknown.
+        """
+        return any(folder.path == folder_path for folder in self.get_folders())
+    
     @abstractmethod
     def get_emails(self, folder_path: str) -> List[Email]:
         """Get all emails from a specific folder.
         
+        Listings carry headers only: body_text is '' and body_html is None
+        for every email, so bulk reads never transfer message content. Use
+        get_email_by_id to retrieve the body of a single email.
+        
         Args:
             folder_path: The path to the folder containing emails.
             
         Returns:
-            List[Email]: All emails in the specified folder.
+            List[Email]: All emails in the specified folder, without bodies.
             
         Raises:
             ValueError: If the folder path does not exist.
         """
         pass
     
+    def iter_emails(self, folder_path: str) -> Iterator[Email]:
+        """Iterate over the emails in a specific folder.
+        
+        The default implementation iterates over get_emails. Adapters backed
+        by a remote store can override this to fetch emails on demand, so
+        callers that filter or stop early avoid materializing the folder.
+        Like get_emails, the emails carry headers only.
+        
+        Args:
+            folder_path: The path to the folder containing emails.
+            
+        Returns:
+            Iterator[Email]: Emails in the specified folder, without bodies.
+            
+        Raises:
+            ValueError: If the folder path does not exist.
+        """
+        return iter(self.get_emails(folder_path))
+    
     @abstractmethod
     def move_email(self, email_id: str, target_folder: str) -> bool:
         """Move an email to a different folder.
@@ -4,7 +4,7 @@ This module provides a real implementation of OutlookAdapter using pywin32
 COM interface to connect to Microsoft Outlook on Windows systems.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -12,14 +12,31 @@ from .outlook_adapter import OutlookAdapter
 from ..models.email import Email
 from ..models.folder import Folder
 
-# Platform-specific imports - only available on Windows
+# Platform-specific imports - only available on Windows. pywintypes is cheap
+# to load; win32com.client is imported on first connection instead, so CLI
+# paths that never touch Outlook do not pay for it.
 try:
-    import win32com.client
     from pywintypes import com_error
     WIN32_AVAILABLE = True
 except ImportError:
     WIN32_AVAILABLE = False
 
+# Outlook OlImportance values mapped to Email.importance labels
+_IMPORTANCE_LABELS = {0: "Low", 1: "Normal", 2: "High"}
+
+# MAPI folder properties, readable from the folder row without opening its Items table
+_PR_DISPLAY_NAME = "http://schemas.microsoft.com/mapi/proptag/0x3001001F"
+_PR_CONTAINER_CLASS = "http://schemas.microsoft.com/mapi/proptag/0x3613001F"
+_PR_CONTENT_COUNT = "http://schemas.microsoft.com/mapi/proptag/0x36020003"
+_PR_CONTENT_UNREAD = "http://schemas.microsoft.com/mapi/proptag/0x36030003"
+_FOLDER_SUMMARY_TAGS = (_PR_DISPLAY_NAME, _PR_CONTAINER_CLASS, _PR_CONTENT_COUNT, _PR_CONTENT_UNREAD)
+
+# Container classes of mail folders; calendar, contacts, tasks etc. hold no emails
+_MAIL_CONTAINER_CLASSES = ("IPF.Note", "IPF.Imap")
+
+# OlItemType for mail folders, used when the container class cannot be read
+_OL_MAIL_ITEM = 0
+
 
 class PyWin32OutlookAdapter(OutlookAdapter):
     """Real Outlook adapter using Windows COM interface.
@@ -40,8 +57,19 @@ class PyWin32OutlookAdapter(OutlookAdapter):
     
     def _connect_to_outlook(self):
         """Establish connection to Outlook COM interface."""
+        import win32com.client
+        
         try:
-            self._outlook = win32com.client.Dispatch("Outlook.Application")
+            try:
+                # Early-bound wrappers from the makepy cache skip the per-call
+                # GetIDsOfNames lookup that late-bound Dispatch performs
+                self._outlook = win32com.client.gencache.EnsureDispatch("Outlook.Application")
+            except (AttributeError, ImportError, TypeError, com_error) as e:
+                # A stale or unwritable gen_py cache, or a type library makepy
+                # cannot load; fall back to late binding, which raises on its own
+                # if Outlook itself is unreachable
+                self._logger.warning("Early-bound dispatch unavailable, using late binding: %s", e)
+                self._outlook = win32com.client.Dispatch("Outlook.Application")
             self._namespace = self._outlook.GetNamespace("MAPI")
             self._logger.info("Successfully connected to Outlook via COM")
         except com_error as e:
@@ -59,71 +87,143 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             # Get all accounts/stores
             folders_collection = self._namespace.Folders
             
-            # COM collections are 1-indexed
-            for i in range(1, folders_collection.Count + 1):
-                try:
-                    account_folder = folders_collection[i]
-                    # Add account folders recursively
-                    folders.extend(self._get_folders_recursive(account_folder, ""))
-                except (IndexError, com_error) as e:
-                    self._logger.warning(f"Skipping inaccessible folder at index {i}: {e}")
-                    continue
+            for account_folder in self._iter_com_folders(folders_collection):
+                folders.extend(self._walk_folder_tree(account_folder))
             
             return folders
             
         except com_error as e:
             raise ValueError(f"Failed to retrieve folders: {e}")
     
-    def _get_folders_recursive(self, com_folder, parent_path: str) -> List[Folder]:
-        """Recursively build folder list from COM folder object.
+    def _iter_com_folders(self, folders_collection) -> Iterator:
+        """Yield folders from a COM Folders collection using its cursor.
+        
+        GetFirst/GetNext advance in constant time, whereas Item(i) can
+        re-walk the collection on some MAPI providers. If the cursor fails on
+        an entry (e.g. an inaccessible shared mailbox), the remaining entries
+        are read by index, skipping any that cannot be accessed.
         
         Args:
-            com_folder: COM folder object
-            parent_path: Path of parent folder
+            folders_collection: COM Folders collection
+            
+        Yields:
+            COM folder objects in collection order
+        """
+        position = 1
+        try:
+            folder = folders_collection.GetFirst()
+            while folder is not None:
+                yield folder
+                position += 1
+                folder = folders_collection.GetNext()
+            return
+        except com_error as e:
+            self._logger.warning("Folder cursor failed at entry %s, continuing by index: %s", position, e)
+        
+        # Collection.Count may exceed the accessible items; skip failing entries
+        try:
+            count = folders_collection.Count
+        except com_error as e:
+            self._logger.warning("Unable to count folders: %s", e)
+            return
+        
+        for i in range(position, count + 1):
+            try:
+                folder = folders_collection.Item(i)
+            except (IndexError, com_error) as e:
+                self._logger.warning("Skipping inaccessible folder at index %s: %s", i, e)
+                continue
+            yield folder
+    
+    def _walk_folder_tree(self, root_folder) -> List[Folder]:
+        """Build the folder list for a COM folder and all of its descendants.
+        
+        Walks the tree with an explicit stack rather than recursion, so deep
+        hierarchies do not hold a Python frame and COM proxy per level. Folders
+        are returned in depth-first pre-order (parent before its children).
+        
+        Args:
+            root_folder: COM folder object to start from
             
         Returns:
             List[Folder]: Folders found in this folder and subfolders
         """
         folders = []
+        stack = [(root_folder, "")]
         
-        try:
-            # Build folder path
-            folder_name = com_folder.Name
-            folder_path = f"{parent_path}/{folder_name}" if parent_path else folder_name
-            
-            # Get folder statistics
+        while stack:
+            com_folder, parent_path = stack.pop()
             try:
-                email_count = com_folder.Items.Count
-                unread_count = com_folder.UnReadItemCount
-            except (AttributeError, com_error):
-                # Some folders may not have these properties
-                email_count = 0
-                unread_count = 0
-            
-            # Create Folder model
-            folder = Folder(
-                path=folder_path,
-                name=folder_name,
-                email_count=email_count,
-                unread_count=unread_count
-            )
-            folders.append(folder)
+                # Get folder name and statistics, then build folder path
+                folder_name, email_count, unread_count = self._get_folder_summary(com_folder)
+                folder_path = f"{parent_path}/{folder_name}" if parent_path else folder_name
+                
+                # Create Folder model
+                folders.append(Folder(
+                    path=folder_path,
+                    name=folder_name,
+                    email_count=email_count,
+                    unread_count=unread_count
+                ))
+                
+                # Queue subfolders, reversed so they pop in collection order.
+                # Every MAPIFolder exposes Folders, so no hasattr probe is needed.
+                subfolders = list(self._iter_com_folders(com_folder.Folders))
+                stack.extend((subfolder, folder_path) for subfolder in reversed(subfolders))
+                
+            except (AttributeError, com_error) as e:
+                self._logger.error("Error processing folder under %s: %s", parent_path or 'root', e)
+        
+        return folders
+    
+    def _get_folder_summary(self, com_folder) -> Tuple[str, int, int]:
+        """Get a COM folder's name with its total and unread item counts.
+        
+        Reads PR_DISPLAY_NAME, PR_CONTAINER_CLASS, PR_CONTENT_COUNT and
+        PR_CONTENT_UNREAD in one PropertyAccessor round-trip, which avoids
+        materializing the Items collection. A tag the store cannot supply
+        comes back as an error code, and only that value falls back to the
+        folder's Name, DefaultItemType or Items properties. Non-mail folders
+        report zero counts.
+        
+        Args:
+            com_folder: COM folder object
             
-            # Process subfolders
-            if hasattr(com_folder, 'Folders'):
-                subfolders = com_folder.Folders
-                for i in range(1, subfolders.Count + 1):
-                    try:
-                        subfolder = subfolders[i]
-                        folders.extend(self._get_folders_recursive(subfolder, folder_path))
-                    except (IndexError, com_error) as e:
-                        self._logger.warning(f"Skipping inaccessible subfolder at index {i}: {e}")
-                        continue
+        Returns:
+            Tuple[str, int, int]: Folder name, total item count and unread item count
             
-        except com_error as e:
-            self._logger.error(f"Error processing folder {parent_path}: {e}")
+        Raises:
+            com_error: If the folder name cannot be read.
+        """
+        try:
+            name, container_class, count, unread = com_folder.PropertyAccessor.GetProperties(
+                _FOLDER_SUMMARY_TAGS
+            )
+        except (AttributeError, com_error):
+            name = container_class = count = unread = None
         
-        return folders
+        if not isinstance(name, str):
+            name = com_folder.Name
+        
+        if isinstance(container_class, str):
+            # Folders without a class (store roots) are treated as mail folders
+            if container_class and not container_class.startswith(_MAIL_CONTAINER_CLASSES):
+                return name, 0, 0
+        else:
+            try:
+                if com_folder.DefaultItemType != _OL_MAIL_ITEM:
+                    return name, 0, 0
+            except (AttributeError, com_error):
+                pass
+        
+        if all(isinstance(value, int) and value >= 0 for value in (count, unread)):
+            return name, count, unread
+        
+        try:
+            return name, com_folder.Items.Count, com_folder.UnReadItemCount
+        except (AttributeError, com_error):
+            # Some folders may not have these properties
+            return name, 0, 0
     
     def get_folder_info(self, folder_path: str) -> Folder:
         """Get information about a specific folder.
@@ -143,16 +243,11 @@ class PyWin32OutlookAdapter(OutlookAdapter):
                 raise ValueError(f"Folder not found: {folder_path}")
             
             # Get folder statistics
-            try:
-                email_count = com_folder.Items.Count
-                unread_count = com_folder.UnReadItemCount
-            except (AttributeError, com_error):
-                email_count = 0
-                unread_count = 0
+            folder_name, email_count, unread_count = self._get_folder_summary(com_folder)
             
             return Folder(
                 path=folder_path,
-                name=com_folder.Name,
+                name=folder_name,
                 email_count=email_count,
                 unread_count=unread_count
             )
@@ -163,11 +258,28 @@ class PyWin32OutlookAdapter(OutlookAdapter):
     def get_emails(self, folder_path: str) -> List[Email]:
         """Get all emails from a specific folder.
         
+        Message bodies are not fetched for bulk listings; use
+        get_email_by_id to retrieve the full content of a single email.
+        
         Args:
             folder_path: The path to the folder containing emails.
             
         Returns:
-            List[Email]: All emails in the specified folder.
+            List[Email]: All emails in the specified folder, without bodies.
+            
+        Raises:
+            ValueError: If the folder path does not exist.
+        """
+        return list(self.iter_emails(folder_path))
+    
+    def iter_emails(self, folder_path: str) -> Iterator[Email]:
+        """Yield emails from a specific folder, converting COM items on demand.
+        
+        Args:
+            folder_path: The path to the folder containing emails.
+            
+        Yields:
+            Email: Each email in the folder, without message bodies.
             
         Raises:
             ValueError: If the folder path does not exist.
@@ -177,24 +289,22 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             if not com_folder:
                 raise ValueError(f"Folder not found: {folder_path}")
             
-            emails = []
             items = com_folder.Items
             
             # COM collections are 1-indexed
             for i in range(1, items.Count + 1):
                 try:
-                    item = items[i]
+                    item = items.Item(i)
                     # Only process email items (ignore calendar, tasks, etc.)
                     if hasattr(item, 'Subject') and hasattr(item, 'SenderEmailAddress'):
-                        email = self._convert_com_email_to_model(item, folder_path)
+                        # Bodies can be MB-sized; listings only need headers
+                        email = self._convert_com_email_to_model(item, folder_path, include_body=False)
                         if email:
-                            emails.append(email)
+                            yield email
                 except (IndexError, com_error) as e:
-                    self._logger.warning(f"Skipping inaccessible email at index {i}: {e}")
+                    self._logger.warning("Skipping inaccessible email at index %s: %s", i, e)
                     continue
             
-            return emails
-            
         except com_error as e:
             raise ValueError(f"Failed to get emails from {folder_path}: {e}")
     
@@ -212,22 +322,22 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             ValueError: If email_id or target_folder does not exist.
         """
         try:
+            # Resolve the target folder first so a bad path fails before the email lookup
+            target_com_folder = self._find_folder_by_path(target_folder)
+            if not target_com_folder:
+                raise ValueError(f"Target folder not found: {target_folder}")
+            
             # Find the email by ID across all folders
             email_item = self._find_email_by_id(email_id)
             if not email_item:
                 raise ValueError(f"Email not found: {email_id}")
             
-            # Find target folder
-            target_com_folder = self._find_folder_by_path(target_folder)
-            if not target_com_folder:
-                raise ValueError(f"Target folder not found: {target_folder}")
-            
             # Move the email
             email_item.Move(target_com_folder)
             return True
             
         except com_error as e:
-            self._logger.error(f"Failed to move email {email_id} to {target_folder}: {e}")
+            self._logger.error("Failed to move email %s to %s: %s", email_id, target_folder, e)
             return False
     
     def get_email_by_id(self, email_id: str) -> Email:
@@ -259,6 +369,26 @@ class PyWin32OutlookAdapter(OutlookAdapter):
         except com_error as e:
             raise ValueError(f"Failed to get email {email_id}: {e}")
     
+    def folder_exists(self, folder_path: str) -> bool:
+        """Check whether a folder path exists without reading its item counts.
+        
+        Args:
+            folder_path: The path to the folder (e.g., 'Inbox', 'Inbox/Subfolder').
+            
+        Returns:
+            bool: True if the folder exists, False otherwise.
+            
+        Raises:
+            ValueError: If Outlook fails while resolving the path.
+        """
+        try:
+            return self._resolve_folder_path(folder_path) is not None
+        except AttributeError:
+            # A path component resolved to something that is not a folder
+            return False
+        except com_error as e:
+            raise ValueError(f"Failed to look up folder {folder_path}: {e}")
+    
     def _find_folder_by_path(self, folder_path: str):
         """Find COM folder object by path string.
         
@@ -266,55 +396,60 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             folder_path: Folder path like 'Inbox' or 'Account/Inbox/Subfolder'
             
         Returns:
-            COM folder object or None if not found
+            COM folder object or None if not found or the lookup fails
         """
         try:
-            # Handle special case for default Inbox
-            if folder_path.lower() == 'inbox':
-                return self._namespace.GetDefaultFolder(6)  # olFolderInbox = 6
-            
-            # Parse path components
-            path_parts = folder_path.split('/')
+            return self._resolve_folder_path(folder_path)
+        except (AttributeError, com_error):
+            return None
+    
+    def _resolve_folder_path(self, folder_path: str):
+        """Walk the folder hierarchy to the COM folder for a path string.
+        
+        Args:
+            folder_path: Folder path like 'Inbox' or 'Account/Inbox/Subfolder'
             
-            # Start with root folders
-            folders_collection = self._namespace.Folders
-            current_folder = None
-            
-            # Navigate through path components
-            for part in path_parts:
-                found = False
-                if current_folder is None:
-                    # Search root level
-                    for i in range(1, folders_collection.Count + 1):
-                        try:
-                            folder = folders_collection[i]
-                            if folder.Name.lower() == part.lower():
-                                current_folder = folder
-                                found = True
-                                break
-                        except (IndexError, com_error):
-                            continue
-                else:
-                    # Search in current folder's subfolders
-                    if hasattr(current_folder, 'Folders'):
-                        subfolders = current_folder.Folders
-                        for i in range(1, subfolders.Count + 1):
-                            try:
-                                folder = subfolders[i]
-                                if folder.Name.lower() == part.lower():
-                                    current_folder = folder
-                                    found = True
-                                    break
-                            except (IndexError, com_error):
-                                continue
-                
-                if not found:
-                    return None
+        Returns:
+            COM folder object or None if not found
             
-            return current_folder
+        Raises:
+            com_error: If Outlook fails while walking the hierarchy.
+        """
+        # Handle special case for default Inbox
+        if folder_path.lower() == 'inbox':
+            return self._namespace.GetDefaultFolder(6)  # olFolderInbox = 6
+        
+        # Parse path components
+        path_parts = folder_path.split('/')
+        
+        # Start with root folders
+        folders_collection = self._namespace.Folders
+        current_folder = None
+        
+        # Navigate through path components
+        for part in path_parts:
+            found = False
+            if current_folder is None:
+                # Search root level
+                candidates = folders_collection
+            else:
+                # Search in current folder's subfolders
+                candidates = current_folder.Folders
+            
+            part_lower = part.lower()
+            for folder in self._iter_com_folders(candidates):
+                try:
+                    if folder.Name.lower() == part_lower:
+                        current_folder = folder
+                        found = True
+                        break
+                except com_error:
+                    continue
             
-        except com_error:
-            return None
+            if not found:
+                return None
+        
+        return current_folder
     
     def _find_email_by_id(self, email_id: str):
         """Find email COM object by ID across all folders.
@@ -325,8 +460,15 @@ class PyWin32OutlookAdapter(OutlookAdapter):
         Returns:
             COM email object or None if not found
         """
-        # For now, implement basic search across common folders
-        # This could be optimized by maintaining an ID-to-folder mapping
+        # EntryIDs resolve directly through MAPI without walking folder items
+        try:
+            item = self._namespace.GetItemFromID(email_id)
+            if item is not None:
+                return item
+        except com_error:
+            # Malformed or foreign-store IDs fall back to the folder scan
+            pass
+
         common_folders = ['Inbox', 'Sent Items', 'Drafts', 'Deleted Items']
         
         for folder_name in common_folders:
@@ -336,7 +478,7 @@ class PyWin32OutlookAdapter(OutlookAdapter):
                     items = com_folder.Items
                     for i in range(1, items.Count + 1):
                         try:
-                            item = items[i]
+                            item = items.Item(i)
                             if hasattr(item, 'EntryID') and item.EntryID == email_id:
                                 return item
                         except (IndexError, com_error):
@@ -365,12 +507,13 @@ class PyWin32OutlookAdapter(OutlookAdapter):
         
         return "Unknown"
     
-    def _convert_com_email_to_model(self, com_email, folder_path: str) -> Optional[Email]:
+    def _convert_com_email_to_model(self, com_email, folder_path: str, include_body: bool = True) -> Optional[Email]:
         """Convert COM email object to Email model.
         
         Args:
             com_email: COM email object
             folder_path: Path of the folder containing this email
+            include_body: Whether to fetch Body/HTMLBody across the COM boundary
             
         Returns:
             Email model instance or None if conversion fails
@@ -385,31 +528,33 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             sender_name = getattr(com_email, 'SenderName', '')
             
             # Extract recipient information
-            recipient_emails = self._extract_recipient_emails(com_email)
-            cc_emails = self._extract_cc_emails(com_email)
+            recipient_emails, cc_emails = self._extract_recipients(com_email)
             bcc_emails = []  # BCC not typically accessible in received emails
             
             # Extract dates and content
             received_date = getattr(com_email, 'ReceivedTime', datetime.now())
-            body_text = getattr(com_email, 'Body', '')
-            body_html = getattr(com_email, 'HTMLBody', None)
+            if include_body:
+                body_text = getattr(com_email, 'Body', '')
+                body_html = getattr(com_email, 'HTMLBody', None)
+            else:
+                body_text = ''
+                body_html = None
             
             # Extract attachment information
-            has_attachments = getattr(com_email, 'Attachments', None) is not None
-            attachment_count = 0
-            if has_attachments:
-                attachments = getattr(com_email, 'Attachments', None)
-                if attachments:
-                    attachment_count = attachments.Count
+            attachments = getattr(com_email, 'Attachments', None)
+            has_attachments = attachments is not None
+            attachment_count = attachments.Count if attachments else 0
             
             # Extract other properties
             is_read = getattr(com_email, 'UnRead', True) == False
-            importance_map = {0: "Low", 1: "Normal", 2: "High"}
-            importance = importance_map.get(getattr(com_email, 'Importance', 1), "Normal")
+            importance = _IMPORTANCE_LABELS.get(getattr(com_email, 'Importance', 1), "Normal")
             
             # Validate required fields
             if not email_id or not sender_email or not recipient_emails:
-                self._logger.warning(f"Email missing required fields: id={bool(email_id)}, sender={bool(sender_email)}, recipients={bool(recipient_emails)}")
+                self._logger.warning(
+                    "Email missing required fields: id=%s, sender=%s, recipients=%s",
+                    bool(email_id), bool(sender_email), bool(recipient_emails)
+                )
                 return None
             
             return Email(
@@ -431,7 +576,7 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             )
             
         except Exception as e:
-            self._logger.error(f"Failed to convert COM email to model: {e}")
+            self._logger.error("Failed to convert COM email to model: %s", e)
             return None
     
     def _extract_sender_smtp(self, com_email) -> str:
@@ -449,8 +594,8 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             if sender_email and '@' in sender_email:
                 return sender_email
             
-            # Handle Exchange DN resolution
-            if sender_email and sender_email.startswith('/O='):
+            # Handle Exchange DN resolution (prefix is case-insensitive, e.g. '/o=')
+            if sender_email and sender_email[:3].upper() == '/O=':
                 resolved_smtp = self._resolve_exchange_dn_to_smtp(sender_email)
                 if resolved_smtp:
                     return resolved_smtp
@@ -464,7 +609,7 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             return "unknown@unknown.com"
             
         except Exception as e:
-            self._logger.warning(f"Failed to extract sender SMTP: {e}")
+            self._logger.warning("Failed to extract sender SMTP: %s", e)
             return "unknown@unknown.com"
     
     def _resolve_exchange_dn_to_smtp(self, exchange_dn: str) -> Optional[str]:
@@ -490,73 +635,50 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             return None
             
         except com_error as e:
-            self._logger.warning(f"Exchange DN resolution failed for {exchange_dn}: {e}")
+            self._logger.warning("Exchange DN resolution failed for %s: %s", exchange_dn, e)
             return None
     
-    def _extract_recipient_emails(self, com_email) -> List[str]:
-        """Extract recipient email addresses.
+    def _extract_recipients(self, com_email) -> Tuple[List[str], List[str]]:
+        """Extract TO and CC recipient addresses in a single pass.
         
         Args:
             com_email: COM email object
             
         Returns:
-            List of recipient SMTP addresses
+            Tuple[List[str], List[str]]: TO recipient and CC recipient SMTP addresses
         """
         recipients = []
-        
-        try:
-            if hasattr(com_email, 'Recipients'):
-                recipients_collection = com_email.Recipients
-                for i in range(1, recipients_collection.Count + 1):
-                    try:
-                        recipient = recipients_collection[i]
-                        # Check if this is a TO recipient (Type 1)
-                        if getattr(recipient, 'Type', 1) == 1:
-                            smtp_address = self._extract_recipient_smtp(recipient)
-                            if smtp_address:
-                                recipients.append(smtp_address)
-                    except (IndexError, com_error):
-                        continue
-            
-            # Ensure at least one recipient
-            if not recipients:
-                recipients.append("unknown@unknown.com")
-            
-        except Exception as e:
-            self._logger.warning(f"Failed to extract recipients: {e}")
-            recipients = ["unknown@unknown.com"]
-        
-        return recipients
-    
-    def _extract_cc_emails(self, com_email) -> List[str]:
-        """Extract CC email addresses.
-        
-        Args:
-            com_email: COM email object
-            
-        Returns:
-            List of CC SMTP addresses
-        """
         cc_recipients = []
         
         try:
             if hasattr(com_email, 'Recipients'):
+                # Bind the collection once; each attribute access is a COM round-trip
                 recipients_collection = com_email.Recipients
                 for i in range(1, recipients_collection.Count + 1):
                     try:
-                        recipient = recipients_collection[i]
-                        # Check if this is a CC recipient (Type 2)
-                        if getattr(recipient, 'Type', 1) == 2:
-                            smtp_address = self._extract_recipient_smtp(recipient)
-                            if smtp_address:
-                                cc_recipients.append(smtp_address)
+                        recipient = recipients_collection.Item(i)
+                        # TO recipients are Type 1, CC recipients are Type 2
+                        recipient_type = getattr(recipient, 'Type', 1)
+                        if recipient_type == 1:
+                            target = recipients
+                        elif recipient_type == 2:
+                            target = cc_recipients
+                        else:
+                            continue
+                        smtp_address = self._extract_recipient_smtp(recipient)
+                        if smtp_address:
+                            target.append(smtp_address)
                     except (IndexError, com_error):
                         continue
             
         except Exception as e:
-            self._logger.warning(f"Failed to extract CC recipients: {e}")
+            self._logger.warning("Failed to extract recipients: %s", e)
+        
+        # Ensure at least one recipient
+        if not recipients:
+            recipients.append("unknown@unknown.com")
         
-        return cc_recipients
+        return recipients, cc_recipients
     
     def _extract_recipient_smtp(self, recipient) -> Optional[str]:
         """Extract SMTP address from recipient object.
@@ -585,5 +707,5 @@ class PyWin32OutlookAdapter(OutlookAdapter):
             return None
             
         except com_error as e:
-            self._logger.warning(f"Failed to extract recipient SMTP: {e}")
+            self._logger.warning("Failed to extract recipient SMTP: %s", e)
             return None
\ No newline at end of file
@@ -22,6 +22,12 @@ init(autoreset=True)
 setup_logging()
 logger = get_logger(__name__)
 
+# Read-status labels indexed by Email.is_read
+_READ_STATUS = ("[UNREAD]", "[READ]")
+
+# Static banner separating headers from the body in the open view
+_CONTENT_HEADER = ("\n" + "=" * 50, "CONTENT:", "=" * 50)
+
 
 def _create_adapter(args) -> 'OutlookAdapter':
     """Create adapter based on CLI arguments and configuration."""
@@ -96,12 +102,12 @@ def _handle_enhanced_error(error: Exception, operation: str) -> None:
     elif isinstance(error, ValueError):
         # Backward compatibility for existing ValueError patterns
         message = str(error)
+        message_lower = message.lower()
         
         # Try to enhance with suggestions based on message content
-        if "not found" in message.lower():
-            if "folder" in message.lower():
-                suggestion = get_error_suggestion("folder_not_found", {"message": message})
-                message += f" {suggestion}"
+        if "not found" in message_lower and "folder" in message_lower:
+            suggestion = get_error_suggestion("folder_not_found", {"message": message})
+            message += f" {suggestion}"
         
         print(f"{Fore.RED}Error: {message}{Style.RESET_ALL}")
     
@@ -110,47 +116,68 @@ def _handle_enhanced_error(error: Exception, operation: str) -> None:
         print(f"{Fore.RED}Error {operation}: {str(error)}{Style.RESET_ALL}")
 
 
+def _format_date(value) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM' for display.
+    
+    Uses isoformat rather than strftime to avoid parsing a format string
+    for every email displayed.
+    """
+    return value.isoformat(sep=' ', timespec='minutes')[:16]
+
+
 def _display_email_page(paginator, current_page):
-    """Display paginated emails with consistent formatting."""
+    """Display paginated emails with consistent formatting.
+    
+    Lines are collected and written with a single print call.
+    """
     page_info = paginator.get_page_info()
     
     # Display pagination info
     start_item = (page_info["current_page"] - 1) * page_info["items_per_page"] + 1
     end_item = min(start_item + len(current_page) - 1, page_info["total_items"])
-    print(f"Page {page_info['current_page']} of {page_info['total_pages']}, showing {start_item}-{end_item} of {page_info['total_items']} emails")
-    print()
+    lines = [
+        f"Page {page_info['current_page']} of {page_info['total_pages']}, showing {start_item}-{end_item} of {page_info['total_items']} emails",
+        "",
+    ]
     
     # Display emails
     for i, email in enumerate(current_page, start=start_item):
-        status = "[UNREAD]" if not email.is_read else "[READ]"
-        print(f"{i}. [{email.id}] {status} Subject: {email.subject}")
-        print(f"   From: {email.sender_name} <{email.sender_email}>")
-        print(f"   Date: {email.received_date.strftime('%Y-%m-%d %H:%M')}")
+        status = _READ_STATUS[email.is_read]
+        lines.append(f"{i}. [{email.id}] {status} Subject: {email.subject}")
+        lines.append(f"   From: {email.sender_name} <{email.sender_email}>")
+        lines.append(f"   Date: {_format_date(email.received_date)}")
         if email.has_attachments:
-            print("   📎 Has attachments")
-        print()
+            lines.append("   📎 Has attachments")
+        lines.append("")
+    
+    print("\n".join(lines))
 
 
 def _display_full_email(email):
-    """Display complete email content with professional formatting."""
-    status = "[UNREAD]" if not email.is_read else "[READ]"
-    print(f"Email ID: {email.id} {status}")
-    print(f"Subject: {email.subject}")
-    print(f"From: {email.sender_name} <{email.sender_email}>")
-    print(f"To: {', '.join(email.recipient_emails)}")
+    """Display complete email content with professional formatting.
+    
+    Lines are collected and written with a single print call.
+    """
+    status = _READ_STATUS[email.is_read]
+    lines = [
+        f"Email ID: {email.id} {status}",
+        f"Subject: {email.subject}",
+        f"From: {email.sender_name} <{email.sender_email}>",
+        f"To: {', '.join(email.recipient_emails)}",
+    ]
     if email.cc_emails:
-        print(f"CC: {', '.join(email.cc_emails)}")
+        lines.append(f"CC: {', '.join(email.cc_emails)}")
     if email.bcc_emails:
-        print(f"BCC: {', '.join(email.bcc_emails)}")
-    print(f"Date: {email.received_date.strftime('%Y-%m-%d %H:%M')}")
-    print(f"Importance: {email.importance}")
+        lines.append(f"BCC: {', '.join(email.bcc_emails)}")
+    lines.append(f"Date: {_format_date(email.received_date)}")
+    lines.append(f"Importance: {email.importance}")
     if email.has_attachments:
-        print(f"📎 Attachments: {email.attachment_count}")
-    print(f"Folder: {email.folder_path}")
-    print("\n" + "="*50)
-    print("CONTENT:")
-    print("="*50)
-    print(email.body_text)
+        lines.append(f"📎 Attachments: {email.attachment_count}")
+    lines.append(f"Folder: {email.folder_path}")
+    lines.extend(_CONTENT_HEADER)
+    lines.append(email.body_text)
+    
+    print("\n".join(lines))
 
 
 def main():
@@ -1,6 +1,6 @@
 """EmailMover service for moving emails between folders."""
 
-from typing import List, Dict
+from typing import Dict, List, Optional
 from outlook_cli.adapters.outlook_adapter import OutlookAdapter
 
 
@@ -14,6 +14,35 @@ class EmailMover:
             adapter: OutlookAdapter instance for email operations.
         """
         self._adapter = adapter
+        self._known_folders: Dict[str, bool] = {}
+    
+    def validate_move(self, email_id: str, target_folder: str) -> Optional[str]:
+        """Check that a move can be attempted without moving anything.
+        
+        The target folder is resolved by path only, without reading its
+        statistics. Definite answers are cached per EmailMover, so validating
+        many moves to the same folder queries the adapter once; lookups that
+        fail are retried on the next call.
+        
+        Args:
+            email_id: The unique identifier of the email to move.
+            target_folder: The path of the target folder.
+            
+        Returns:
+            Optional[str]: Error message if the move is invalid, otherwise None.
+        """
+        if not email_id:
+            return "Email ID must not be empty"
+        
+        if target_folder not in self._known_folders:
+            try:
+                self._known_folders[target_folder] = self._adapter.folder_exists(target_folder)
+            except ValueError as e:
+                return f"Could not verify target folder '{target_folder}': {e}"
+        
+        if not self._known_folders[target_folder]:
+            return f"Target folder '{target_folder}' not found"
+        return None
     
     def move_email_to_folder(self, email_id: str, target_folder: str) -> bool:
         """Move a single email to the target folder.
@@ -39,10 +68,14 @@ class EmailMover:
             
         Returns:
             Dict[str, bool]: Dictionary mapping email_id to success status.
+            Repeated IDs are moved once, in order of first appearance.
         """
         results = {}
         
-        for email_id in email_ids:
+        for email_id in dict.fromkeys(email_ids):
+            if self.validate_move(email_id, target_folder):
+                results[email_id] = False
+                continue
             try:
                 success = self._adapter.move_email(email_id, target_folder)
                 results[email_id] = success
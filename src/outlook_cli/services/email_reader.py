@@ -1,6 +1,6 @@
 """EmailReader service for retrieving emails from folders."""
 
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from outlook_cli.adapters.outlook_adapter import OutlookAdapter
 from outlook_cli.models.email import Email
 
@@ -30,6 +30,20 @@ class EmailReader:
         """
         return self._adapter.get_emails(folder_path)
     
+    def iter_emails_from_folder(self, folder_path: str) -> Iterator[Email]:
+        """Iterate over the emails in a specific folder without building a list.
+        
+        Args:
+            folder_path: Path to the folder (e.g., 'Inbox', 'Sent Items').
+            
+        Returns:
+            Iterator[Email]: Emails in the specified folder.
+            
+        Raises:
+            ValueError: If the folder path does not exist.
+        """
+        return self._adapter.iter_emails(folder_path)
+    
     def get_all_emails(self) -> Dict[str, List[Email]]:
         """Get all emails from all folders.
         
@@ -1,6 +1,6 @@
 """EmailSearcher service for filtering emails by various criteria."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from outlook_cli.adapters.outlook_adapter import OutlookAdapter
 from outlook_cli.models.email import Email
 from outlook_cli.services.email_reader import EmailReader
@@ -18,6 +18,28 @@ class EmailSearcher:
         self._adapter = adapter
         self._email_reader = EmailReader(adapter)
     
+    def _iter_candidate_emails(self, folder_path: Optional[str]) -> Iterable[Email]:
+        """Get the emails to filter from a specific folder or all folders.
+        
+        Args:
+            folder_path: Optional folder to search in. If None, searches all folders.
+            
+        Returns:
+            Iterable[Email]: Emails to apply search filters to.
+            
+        Raises:
+            ValueError: If the folder path does not exist.
+        """
+        if folder_path:
+            return self._email_reader.iter_emails_from_folder(folder_path)
+        
+        # Stream folder by folder so no folder's emails are listed before filtering
+        return (
+            email
+            for folder in self._adapter.get_folders()
+            for email in self._email_reader.iter_emails_from_folder(folder.path)
+        )
+    
     def search_by_sender(self, sender: str, folder_path: Optional[str] = None) -> List[Email]:
         """Search emails by sender email address or display name.
         
@@ -31,12 +53,7 @@ class EmailSearcher:
         Raises:
             ValueError: If the folder path does not exist.
         """
-        # Get emails from specific folder or all folders
-        if folder_path:
-            emails = self._email_reader.get_emails_from_folder(folder_path)
-        else:
-            all_emails = self._email_reader.get_all_emails()
-            emails = [email for folder_emails in all_emails.values() for email in folder_emails]
+        emails = self._iter_candidate_emails(folder_path)
         
         # Filter by sender (case-insensitive, match email or display name)
         sender_lower = sender.lower()
@@ -58,12 +75,7 @@ class EmailSearcher:
         Raises:
             ValueError: If the folder path does not exist.
         """
-        # Get emails from specific folder or all folders
-        if folder_path:
-            emails = self._email_reader.get_emails_from_folder(folder_path)
-        else:
-            all_emails = self._email_reader.get_all_emails()
-            emails = [email for folder_emails in all_emails.values() for email in folder_emails]
+        emails = self._iter_candidate_emails(folder_path)
         
         # Filter by subject (case-insensitive partial match)
         subject_lower = subject.lower()
@@ -86,28 +98,16 @@ class EmailSearcher:
         Raises:
             ValueError: If the folder path does not exist.
         """
-        # Get emails from specific folder or all folders
-        if folder_path:
-            emails = self._email_reader.get_emails_from_folder(folder_path)
-        else:
-            all_emails = self._email_reader.get_all_emails()
-            emails = [email for folder_emails in all_emails.values() for email in folder_emails]
+        emails = self._iter_candidate_emails(folder_path)
         
-        # Apply filters with AND logic
-        filtered_emails = emails
+        sender_lower = sender.lower() if sender else None
+        subject_lower = subject.lower() if subject else None
         
-        if sender:
-            sender_lower = sender.lower()
-            filtered_emails = [
-                email for email in filtered_emails
-                if sender_lower in email.sender_email.lower() or sender_lower in email.sender_name.lower()
-            ]
-        
-        if subject:
-            subject_lower = subject.lower()
-            filtered_emails = [
-                email for email in filtered_emails
-                if subject_lower in email.subject.lower()
-            ]
-        
-        return filtered_emails
\ No newline at end of file
+        # Apply both filters with AND logic in a single pass
+        return [
+            email for email in emails
+            if (sender_lower is None
+                or sender_lower in email.sender_email.lower()
+                or sender_lower in email.sender_name.lower())
+            and (subject_lower is None or subject_lower in email.subject.lower())
+        ]
@@ -102,14 +102,11 @@ def get_error_suggestion(error_type: str, context: Optional[Dict[str, Any]] = No
     """
     context = context or {}
     
-    suggestions = {
-        "folder_not_found": _get_folder_not_found_suggestion(context),
-        "connection_failed": "Please ensure Outlook is running and try again.",
-        "timeout": _get_timeout_suggestion(context),
-        "validation_failed": _get_validation_suggestion(context),
-    }
-    
-    return suggestions.get(error_type, "Use 'outlook-cli --help' for usage information.")
+    # Only the builder for the requested error type is evaluated
+    builder = _SUGGESTION_BUILDERS.get(error_type)
+    if builder is None:
+        return "Use 'outlook-cli --help' for usage information."
+    return builder(context)
 
 
 def _get_folder_not_found_suggestion(context: Dict[str, Any]) -> str:
@@ -125,6 +122,11 @@ def _get_folder_not_found_suggestion(context: Dict[str, Any]) -> str:
         return "Check the folder name spelling. Use 'read --help' to see available folders."
 
 
+def _get_connection_failed_suggestion(context: Dict[str, Any]) -> str:
+    """Generate suggestion for connection failures."""
+    return "Please ensure Outlook is running and try again."
+
+
 def _get_timeout_suggestion(context: Dict[str, Any]) -> str:
     """Generate suggestion for timeout errors."""
     timeout_seconds = context.get("timeout_seconds", 30)
@@ -139,4 +141,13 @@ def _get_validation_suggestion(context: Dict[str, Any]) -> str:
     if field == "email" and value:
         return f"The email address '{value}' is not valid. Please use format: user@domain.com"
     else:
-        return f"Please check the {field} value and try again."
\ No newline at end of file
+        return f"Please check the {field} value and try again."
+
+
+# Suggestion builders keyed by error type, used by get_error_suggestion
+_SUGGESTION_BUILDERS = {
+    "folder_not_found": _get_folder_not_found_suggestion,
+    "connection_failed": _get_connection_failed_suggestion,
+    "timeout": _get_timeout_suggestion,
+    "validation_failed": _get_validation_suggestion,
+}
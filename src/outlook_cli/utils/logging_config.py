@@ -39,8 +39,8 @@ def setup_logging(log_file: Optional[str] = None, level: int = logging.INFO) ->
     
     # Console handler removed - file logging only for clean CLI output
     
-    # File handler
-    file_handler = logging.FileHandler(log_file)
+    # File handler - the file is opened on the first emitted record, not at setup
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
@@ -116,7 +116,8 @@ class ProgressTracker:
 
     def get_progress_message(self) -> str:
         """Get formatted progress message."""
-        percentage = int(self.progress_percentage) if self.progress_percentage == int(self.progress_percentage) else f"{self.progress_percentage:.1f}"
+        progress = self.progress_percentage
+        percentage = int(progress) if progress.is_integer() else f"{progress:.1f}"
         return f"{self.operation}: {self.processed_items}/{self.total_items} ({percentage}%)"
 
 
@@ -197,10 +198,11 @@ def timeout_operation(
         total_items = 0
     tracker = ProgressTracker(total_items, operation)
     
-    start_time = time.time()
+    # perf_counter is monotonic and high resolution, unlike the wall clock
+    start_time = time.perf_counter()
     
     def check_timeout():
-        if time.time() - start_time > timeout_seconds:
+        if time.perf_counter() - start_time > timeout_seconds:
             raise OutlookTimeoutError(
                 f"{operation} timed out",
                 timeout_seconds=timeout_seconds,
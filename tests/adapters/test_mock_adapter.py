@@ -62,8 +62,11 @@ def test_get_emails_returns_emails_for_valid_folder():
         assert email.sender_name
         assert email.recipient_emails
         assert email.received_date
-        assert email.body_text
         assert email.folder_path == "Inbox"
+        # Listings carry headers only; the body comes from get_email_by_id
+        assert email.body_text == ""
+        assert email.body_html is None
+        assert adapter.get_email_by_id(email.id).body_text
 
 
 def test_get_emails_returns_different_emails_for_different_folders():
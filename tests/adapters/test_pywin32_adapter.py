@@ -0,0 +1,213 @@
+"""Tests for PyWin32OutlookAdapter conversion logic using fake COM objects."""
+
+import logging
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from outlook_cli.adapters import pywin32_adapter
+from outlook_cli.adapters.pywin32_adapter import PyWin32OutlookAdapter
+
+
+class FakeComError(Exception):
+    """Stand-in for pywintypes.com_error on platforms without pywin32."""
+
+
+class FakeCollection:
+    """1-indexed COM collection exposing Count and Item()."""
+
+    def __init__(self, items):
+        self._items = list(items)
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def Item(self, index):
+        return self._items[index - 1]
+
+
+class FakeFolders(FakeCollection):
+    """Folders collection whose cursor and indexer fail on given positions."""
+
+    def __init__(self, items, broken_positions=()):
+        super().__init__(items)
+        self._broken = set(broken_positions)
+        self._cursor = 0
+
+    def _read(self, position):
+        if position in self._broken:
+            raise FakeComError(f"entry {position} is inaccessible")
+        return self._items[position - 1] if position <= len(self._items) else None
+
+    def Item(self, index):
+        if index in self._broken:
+            raise FakeComError(f"entry {index} is inaccessible")
+        return super().Item(index)
+
+    def GetFirst(self):
+        self._cursor = 1
+        return self._read(self._cursor)
+
+    def GetNext(self):
+        self._cursor += 1
+        return self._read(self._cursor)
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Create an adapter without connecting to Outlook."""
+    monkeypatch.setattr(pywin32_adapter, "com_error", FakeComError, raising=False)
+    adapter = PyWin32OutlookAdapter.__new__(PyWin32OutlookAdapter)
+    adapter._logger = logging.getLogger(__name__)
+    adapter._outlook = None
+    adapter._namespace = None
+    return adapter
+
+
+def _make_com_email():
+    recipients = FakeCollection([
+        SimpleNamespace(Type=1, AddressEntry=None, Address="user@company.com"),
+        SimpleNamespace(Type=2, AddressEntry=None, Address="cc@company.com"),
+    ])
+    return SimpleNamespace(
+        EntryID="entry-001",
+        Subject="Quarterly report",
+        SenderEmailAddress="manager@company.com",
+        SenderName="Alice Manager",
+        Recipients=recipients,
+        ReceivedTime=datetime(2025, 1, 15, 9, 30, tzinfo=timezone.utc),
+        Body="Full report text",
+        HTMLBody="<p>Full report text</p>",
+        Attachments=FakeCollection([]),
+        UnRead=False,
+        Importance=2,
+    )
+
+
+def test_convert_com_email_without_body_returns_headers_only(adapter):
+    """Test that include_body=False leaves the body empty but keeps the headers."""
+    email = adapter._convert_com_email_to_model(_make_com_email(), "Inbox", include_body=False)
+
+    assert email.id == "entry-001"
+    assert email.subject == "Quarterly report"
+    assert email.recipient_emails == ["user@company.com"]
+    assert email.cc_emails == ["cc@company.com"]
+    assert email.is_read is True
+    assert email.importance == "High"
+    assert email.body_text == ""
+    assert email.body_html is None
+
+
+def test_convert_com_email_with_body_includes_content(adapter):
+    """Test that the default conversion fetches both message bodies."""
+    email = adapter._convert_com_email_to_model(_make_com_email(), "Inbox")
+
+    assert email.body_text == "Full report text"
+    assert email.body_html == "<p>Full report text</p>"
+
+
+def test_iter_com_folders_yields_all_folders_via_cursor(adapter):
+    """Test that folders are enumerated in collection order."""
+    folders = FakeFolders(["Inbox", "Drafts", "Archive"])
+
+    assert list(adapter._iter_com_folders(folders)) == ["Inbox", "Drafts", "Archive"]
+
+
+def test_iter_com_folders_skips_only_the_inaccessible_entry(adapter):
+    """Test that a failing entry does not hide the folders after it."""
+    folders = FakeFolders(["Mailbox", "Broken PST", "Shared", "Archive"], broken_positions={2})
+
+    assert list(adapter._iter_com_folders(folders)) == ["Mailbox", "Shared", "Archive"]
+
+
+def test_iter_com_folders_continues_when_first_entry_fails(adapter):
+    """Test that a failing GetFirst still yields the remaining folders."""
+    folders = FakeFolders(["Broken", "Inbox"], broken_positions={1})
+
+    assert list(adapter._iter_com_folders(folders)) == ["Inbox"]
+
+
+class FakeFolder:
+    """COM folder whose row properties come back from one GetProperties call."""
+
+    def __init__(self, row, name="Fallback", item_count=0, unread_count=0):
+        self.PropertyAccessor = SimpleNamespace(GetProperties=lambda tags: row)
+        self.Name = name
+        self.DefaultItemType = 0
+        self.Items = FakeCollection([None] * item_count)
+        self.UnReadItemCount = unread_count
+
+
+def test_folder_summary_reads_name_and_counts_in_one_call(adapter):
+    """Test that a mail folder's name and counters come from the batched row."""
+    folder = FakeFolder(("Inbox", "IPF.Note", 42, 5))
+
+    assert adapter._get_folder_summary(folder) == ("Inbox", 42, 5)
+
+
+def test_folder_summary_reports_zero_counts_for_non_mail_folder(adapter):
+    """Test that calendar and other non-mail folders report no emails."""
+    folder = FakeFolder(("Calendar", "IPF.Appointment", 17, 0))
+
+    assert adapter._get_folder_summary(folder) == ("Calendar", 0, 0)
+
+
+def test_folder_summary_falls_back_when_tags_return_error_codes(adapter):
+    """Test that MAPI error codes in the row fall back to the folder properties."""
+    not_found = -2147221233  # MAPI_E_NOT_FOUND
+    folder = FakeFolder((not_found, not_found, not_found, not_found),
+                        name="Archive", item_count=3, unread_count=1)
+
+    assert adapter._get_folder_summary(folder) == ("Archive", 3, 1)
+
+
+def test_folder_exists_raises_value_error_when_lookup_fails(adapter):
+    """Test that a COM failure during path lookup is not reported as a missing folder."""
+    class BrokenNamespace:
+        @property
+        def Folders(self):
+            raise FakeComError("RPC server unavailable")
+
+    adapter._namespace = BrokenNamespace()
+
+    with pytest.raises(ValueError, match="Failed to look up folder"):
+        adapter.folder_exists("Account/Projects")
+
+
+def _install_fake_win32com(monkeypatch, ensure_dispatch, dispatch):
+    client = SimpleNamespace(
+        gencache=SimpleNamespace(EnsureDispatch=ensure_dispatch),
+        Dispatch=dispatch,
+    )
+    monkeypatch.setitem(sys.modules, "win32com", SimpleNamespace(client=client))
+    monkeypatch.setitem(sys.modules, "win32com.client", client)
+
+
+def test_connect_falls_back_to_late_binding_when_makepy_fails(adapter, monkeypatch):
+    """Test that a com_error from EnsureDispatch falls back to plain Dispatch."""
+    namespace = object()
+    outlook = SimpleNamespace(GetNamespace=lambda name: namespace)
+
+    def ensure_dispatch(prog_id):
+        raise FakeComError("Library not registered")
+
+    _install_fake_win32com(monkeypatch, ensure_dispatch, lambda prog_id: outlook)
+
+    adapter._connect_to_outlook()
+
+    assert adapter._outlook is outlook
+    assert adapter._namespace is namespace
+
+
+def test_connect_raises_value_error_when_late_binding_also_fails(adapter, monkeypatch):
+    """Test that connection fails only when both dispatch paths fail."""
+    def fail(prog_id):
+        raise FakeComError("Server execution failed")
+
+    _install_fake_win32com(monkeypatch, fail, fail)
+
+    with pytest.raises(ValueError, match="Failed to connect to Outlook"):
+        adapter._connect_to_outlook()
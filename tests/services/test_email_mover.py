@@ -1,6 +1,7 @@
 """Tests for EmailMover service."""
 
 import pytest
+from unittest.mock import patch
 from outlook_cli.services.email_mover import EmailMover
 from outlook_cli.adapters.mock_adapter import MockOutlookAdapter
 from outlook_cli.adapters.outlook_adapter import OutlookAdapter
@@ -104,6 +105,71 @@ class TestEmailMover:
         assert results["inbox-001"] is False  # Failed due to bad folder
         assert results["inbox-002"] is False  # Failed due to bad folder
     
+    def test_validate_move_returns_none_for_valid_move(self):
+        """Test that validate_move returns None when the target folder exists."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        mover = EmailMover(adapter)
+        
+        # Act & Assert
+        assert mover.validate_move("inbox-001", "Drafts") is None
+    
+    def test_validate_move_reports_missing_target_folder_once(self):
+        """Test that validate_move reports a bad folder and caches the folder lookup."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        mover = EmailMover(adapter)
+        
+        # Act
+        with patch.object(adapter, 'folder_exists', wraps=adapter.folder_exists) as folder_exists, \
+             patch.object(adapter, 'get_folder_info') as get_folder_info:
+            first = mover.validate_move("inbox-001", "BadFolder")
+            second = mover.validate_move("inbox-002", "BadFolder")
+        
+        # Assert
+        assert first == "Target folder 'BadFolder' not found"
+        assert second == first
+        assert folder_exists.call_count == 1
+        get_folder_info.assert_not_called()
+    
+    def test_validate_move_retries_folder_lookup_after_failure(self):
+        """Test that a failed folder lookup is reported but not cached."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        mover = EmailMover(adapter)
+        
+        # Act
+        with patch.object(adapter, 'folder_exists', side_effect=[ValueError("RPC unavailable"), True]):
+            first = mover.validate_move("inbox-001", "Drafts")
+            second = mover.validate_move("inbox-001", "Drafts")
+        
+        # Assert
+        assert first == "Could not verify target folder 'Drafts': RPC unavailable"
+        assert second is None
+    
+    def test_validate_move_rejects_empty_email_id(self):
+        """Test that validate_move reports an empty email ID."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        mover = EmailMover(adapter)
+        
+        # Act & Assert
+        assert mover.validate_move("", "Drafts") == "Email ID must not be empty"
+    
+    def test_move_multiple_emails_moves_repeated_id_once(self):
+        """Test that move_multiple_emails dispatches a repeated email ID only once."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        mover = EmailMover(adapter)
+        
+        # Act
+        with patch.object(adapter, 'move_email', wraps=adapter.move_email) as move_email:
+            results = mover.move_multiple_emails(["inbox-001", "inbox-001"], "Drafts")
+        
+        # Assert
+        assert results == {"inbox-001": True}
+        move_email.assert_called_once_with("inbox-001", "Drafts")
+    
     def test_move_multiple_emails_with_empty_list(self):
         """Test that move_multiple_emails handles empty email list."""
         # Arrange
@@ -47,6 +47,19 @@ class TestEmailReader:
         with pytest.raises(ValueError, match="Folder 'NonExistentFolder' not found"):
             reader.get_emails_from_folder("NonExistentFolder")
     
+    def test_iter_emails_from_folder_yields_same_emails_as_list(self):
+        """Test that iter_emails_from_folder yields the folder's emails lazily."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        reader = EmailReader(adapter)
+        
+        # Act
+        emails = reader.iter_emails_from_folder("Inbox")
+        
+        # Assert
+        assert not isinstance(emails, list)
+        assert [email.id for email in emails] == [email.id for email in reader.get_emails_from_folder("Inbox")]
+    
     def test_get_all_emails_returns_dict_of_folder_emails(self):
         """Test that get_all_emails returns Dict[str, List[Email]] for all folders."""
         # Arrange
@@ -1,6 +1,8 @@
 """Tests for EmailSearcher service."""
 
 import pytest
+from unittest.mock import patch
+from outlook_cli.services.email_reader import EmailReader
 from outlook_cli.services.email_searcher import EmailSearcher
 from outlook_cli.adapters.mock_adapter import MockOutlookAdapter
 from outlook_cli.adapters.outlook_adapter import OutlookAdapter
@@ -152,6 +154,33 @@ class TestEmailSearcher:
         assert isinstance(results, list)
         assert len(results) == 0
     
+    def test_search_emails_without_criteria_returns_list_of_folder_emails(self):
+        """Test that search_emails with no filters returns every email in the folder as a list."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        searcher = EmailSearcher(adapter)
+        
+        # Act
+        results = searcher.search_emails(folder_path="Inbox")
+        
+        # Assert
+        assert isinstance(results, list)
+        assert len(results) == 3
+    
+    def test_search_across_all_folders_streams_without_listing_every_folder(self):
+        """Test that an all-folder search reads folders lazily instead of via get_all_emails."""
+        # Arrange
+        adapter = MockOutlookAdapter()
+        searcher = EmailSearcher(adapter)
+        
+        # Act
+        with patch.object(EmailReader, 'get_all_emails', side_effect=AssertionError("lists every folder")):
+            results = searcher.search_by_sender("user@company.com")
+        
+        # Assert
+        assert len(results) > 0
+        assert all(email.sender_email == "user@company.com" for email in results)
+    
     def test_search_raises_error_for_invalid_folder_path(self):
         """Test that search methods raise ValueError for invalid folder path."""
         # Arrange
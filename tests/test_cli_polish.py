@@ -131,4 +131,12 @@ class TestCLIPolish:
             
             for example in expected_examples:
                 assert example in help_output, \
-                    f"Example '{example}' not found in help output: {help_output}"
\ No newline at end of file
+                    f"Example '{example}' not found in help output: {help_output}"
+    
+    def test_dates_display_to_the_minute_for_naive_and_aware_datetimes(self):
+        """Test that displayed dates use 'YYYY-MM-DD HH:MM' regardless of timezone info."""
+        from datetime import datetime, timezone
+        from outlook_cli.cli import _format_date
+        
+        assert _format_date(datetime(2024, 6, 28, 9, 5, 42)) == "2024-06-28 09:05"
+        assert _format_date(datetime(2024, 6, 28, 9, 5, 42, 123456, tzinfo=timezone.utc)) == "2024-06-28 09:05"
@@ -123,6 +123,17 @@ class TestLoggingConfig:
             assert "Debug message should not appear" not in content
             assert "Info message should appear" in content
 
+    def test_setup_logging_defers_opening_log_file_until_first_record(self):
+        """Test that setup_logging does not create the log file until something is logged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "deferred.log"
+            
+            setup_logging(log_file=str(log_file))
+            assert not log_file.exists()
+            
+            get_logger("deferred_test").info("First record")
+            assert "First record" in log_file.read_text(encoding="utf-8")
+
     def test_setup_logging_handles_missing_log_directory(self):
         """Test that setup_logging creates log directory if it doesn't exist."""
         with tempfile.TemporaryDirectory() as temp_dir: